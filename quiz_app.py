@@ -10,33 +10,116 @@ from tkinter import messagebox, filedialog
 import json
 import random
 import time
-from datetime import datetime
 import os
+import sys
+import threading
 import re
+import functools
+import logging
+from array import array
+from heapq import nlargest
+from operator import itemgetter
 
 # Set appearance mode and color theme
 ctk.set_appearance_mode("dark")  # Options: "System", "Dark", "Light"
 ctk.set_default_color_theme("blue")  # Options: "blue", "green", "dark-blue"
 
-# Try to import Arabic text processing libraries
+log = logging.getLogger(__name__)
+
+# Seconds allowed per question
+QUESTION_TIME_LIMIT = 30
+
+# High scores file, kept in the working directory
+SCORES_FILE = 'quiz_scores.json'
+
+# Remembers the last question bank the user picked
+CONFIG_FILE = os.path.expanduser('~/.quizmasterpro.json')
+
+# Arabic script ranges, compiled once and shared by every screen
+_ARABIC_RE = re.compile(r'[\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF\uFB50-\uFDFF\uFE70-\uFEFF]')
+
+@functools.lru_cache(maxsize=2048)
+def _is_arabic(text):
+    """Whether text contains any Arabic characters (memoized per string)"""
+    return bool(_ARABIC_RE.search(text))
+
+# Use orjson for reading/writing JSON files when available
 try:
-    import arabic_reshaper
-    from bidi.algorithm import get_display
-    ARABIC_SUPPORT = True
+    import orjson
+    _loads = orjson.loads
+    
+    def _dumps(obj):
+        """Serialize to indented UTF-8 JSON bytes"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
 except ImportError:
-    ARABIC_SUPPORT = False
-    print("Arabic support libraries not found. Installing...")
+    _loads = json.loads
+    
+    def _dumps(obj):
+        """Serialize to indented UTF-8 JSON bytes"""
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+# Arabic text processing libraries are imported on first use (see _get_shaper)
+ARABIC_SUPPORT = None  # Unknown until the first Arabic string is shaped
+_reshape = None
+_get_display = None
+
+def _get_shaper():
+    """Import the Arabic text processing libraries once; return whether they are available"""
+    global ARABIC_SUPPORT, _reshape, _get_display
+    if ARABIC_SUPPORT is None:
+        try:
+            import arabic_reshaper
+            from bidi.algorithm import get_display
+        except ImportError:
+            ARABIC_SUPPORT = False
+            log.warning("Arabic support libraries not found. Arabic text may not display correctly. "
+                        "Run with --install-deps to install them.")
+        else:
+            _reshape = arabic_reshaper.reshape
+            _get_display = get_display
+            ARABIC_SUPPORT = True
+    return ARABIC_SUPPORT
+
+def install_arabic_support():
+    """Install the Arabic text processing libraries with pip"""
     import subprocess
-    import sys
+    print("Installing Arabic support libraries...")
     try:
         subprocess.check_call([sys.executable, "-m", "pip", "install", "arabic-reshaper", "python-bidi"])
-        import arabic_reshaper
-        from bidi.algorithm import get_display
-        ARABIC_SUPPORT = True
         print("Arabic support libraries installed successfully.")
-    except:
+    except (OSError, subprocess.CalledProcessError):
         print("Failed to install Arabic support libraries. Arabic text may not display correctly.")
 
+@functools.lru_cache(maxsize=4096)
+def _process_text_cached(text):
+    """Reshape and reorder Arabic text once per unique string"""
+    # Check if text contains Arabic characters
+    if _is_arabic(text) and _get_shaper():
+        # Reshape Arabic text for proper display
+        reshaped_text = _reshape(text)
+        # Apply bidirectional algorithm for correct display
+        bidi_text = _get_display(reshaped_text)
+        return bidi_text
+    return text
+
+# Shared fonts keyed by (size, weight); created on first use, after the root window exists
+_FONT_CACHE = {}
+
+def _font(size, weight="normal"):
+    """Return a shared CTkFont for this size and weight"""
+    key = (size, weight)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        font = ctk.CTkFont(size=size, weight=weight)
+        _FONT_CACHE[key] = font
+    return font
+
+# Static results-screen strings: (is_arabic_quiz) -> text
+# Shaped on first display through the process_text cache, not at import time
+_RESULTS_TITLE = {False: "Quiz Complete!", True: "انتهى الاختبار!"}
+_PLAY_AGAIN_TEXT = {False: "Play Again", True: "العب مرة أخرى"}
+_MAIN_MENU_TEXT = {False: "Main Menu", True: "القائمة الرئيسية"}
+
 class ModernQuizApp:
     def __init__(self, root):
         self.root = root
@@ -49,36 +132,52 @@ class ModernQuizApp:
         
         # Track the current question bank file
         self.current_question_file = None
+        self._cat_is_arabic = {}  # Category name -> contains Arabic
+        self._display_cat = {}  # Category name -> shaped display text
+        self._banks = {}  # Category name -> parallel per-question arrays (see _preprocess_questions)
+        self._display_topic_label = ""  # "Topic: <category>" for the current quiz
         
-        # Initialize with a default question bank
-        self.create_default_question_bank()
+        # Questions are loaded once a file is picked; the default bank is
+        # only created if the user cancels the file dialog
+        self.questions_db = {}
         
         # Game state variables
         self.current_cat = None
-        self.quiz_questions = []
+        self._bank = None  # self._banks entry for the current quiz
+        self._order = []  # Shuffled question indices into self._bank
         self.q_number = 0
         self.player_score = 0
         self.wrong_answers = 0  # Track wrong answers separately
-        self.time_remaining = 30
+        self.time_remaining = QUESTION_TIME_LIMIT
         self.timer_active = False
+        self._deadline = 0.0  # time.monotonic() when the current question expires
+        self._last_shown = None  # Last second written to the timer label
+        self._timeout_after_id = None
+        self._tick_after_id = None
         self.chosen_option = None
         self.game_in_progress = False
         self.answer_locked = False  # Prevent multiple clicks
         
-        # Wait a bit before showing file dialog
+        # High scores are read once and kept in memory; saves write them back
+        self._scores_db = self.load_scores()
+        
+        # Build all screens up front; only one is visible at a time
+        self._build_screens()
+        
+        # Reopen the question bank picked last time, if it's still there
+        last_file = self.load_config().get('last')
+        if isinstance(last_file, str) and os.path.isfile(last_file) and self.load_questions_from_file(last_file):
+            self.current_question_file = last_file
+        
+        # Wait a bit before showing file dialog (skipped if a bank is already loaded)
         self.root.after(100, self.select_question_file)
         
     def process_text(self, text):
         """Process text for proper display, handling Arabic RTL"""
-        # Check if text contains Arabic characters using regex directly
-        arabic_pattern = re.compile(r'[\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF\uFB50-\uFDFF\uFE70-\uFEFF]')
-        if arabic_pattern.search(text) and ARABIC_SUPPORT:
-            # Reshape Arabic text for proper display
-            reshaped_text = arabic_reshaper.reshape(text)
-            # Apply bidirectional algorithm for correct display
-            bidi_text = get_display(reshaped_text)
-            return bidi_text
-        return text
+        # Pure ASCII can't contain Arabic; skip the cache and regex entirely
+        if text.isascii():
+            return text
+        return _process_text_cached(text)
         
     def create_default_question_bank(self):
         """Create a simple default question bank in current directory"""
@@ -104,13 +203,43 @@ class ModernQuizApp:
             ]
         }
         
-        # Save to a file in the current directory
+        # Save to a file in the current directory without blocking the UI,
+        # unless an earlier run already wrote it.
+        # Encode here so the worker thread never touches the live dicts.
         file_path = os.path.join(os.getcwd(), "default_questions.json")
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(default_questions, f, indent=2, ensure_ascii=False)
+        if not os.path.exists(file_path):
+            threading.Thread(
+                target=self._write_file,
+                args=(file_path, _dumps(default_questions)),
+                daemon=True
+            ).start()
             
         self.current_question_file = file_path
-        self.questions_db = default_questions
+        self._preprocess_questions(default_questions)
+        
+    @staticmethod
+    def _write_file(file_path, data):
+        """Write bytes to a temp file and swap it in so readers never see a partial file"""
+        tmp_path = file_path + '.tmp'
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, file_path)
+        except OSError as e:
+            log.warning("Failed to write %s: %s", file_path, e)
+        
+    def load_config(self):
+        """Load saved settings, or an empty dict if there are none"""
+        try:
+            with open(CONFIG_FILE, 'rb') as f:
+                config = _loads(f.read())
+        except (OSError, ValueError):
+            return {}
+        return config if isinstance(config, dict) else {}
+        
+    def save_config(self, last_file):
+        """Remember the question bank file for the next launch"""
+        self._write_file(CONFIG_FILE, _dumps({'last': last_file}))
         
     def select_question_file(self):
         """Open file dialog to select a question bank JSON file"""
@@ -121,26 +250,66 @@ class ModernQuizApp:
                 filetypes=[("JSON Files", "*.json"), ("All Files", "*.*")]
             )
             
-            if not file_path:  # User cancelled
-                # Keep using default
-                self.show_main_screen()
-                return
+            if file_path and self.load_questions_from_file(file_path):
+                self.current_question_file = file_path
+                self.save_config(file_path)
+            else:
+                # User cancelled (or the file failed to load) - use the default bank
+                self.create_default_question_bank()
                 
-            self.current_question_file = file_path
-            self.load_questions_from_file(file_path)
-        else:
-            self.show_main_screen()
+        self.show_main_screen()
             
     def load_questions_from_file(self, file_path):
         """Load questions from the specified file path"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                self.questions_db = json.load(f)
+            with open(file_path, 'rb') as f:
+                questions_db = _loads(f.read())
+            self._preprocess_questions(questions_db)
             return True
-        except (FileNotFoundError, json.JSONDecodeError) as e:
+        except (OSError, ValueError, KeyError, OverflowError) as e:
             messagebox.showerror("Error", f"Failed to load questions from {file_path}:\n{str(e)}")
             return False
     
+    def _preprocess_questions(self, questions_db):
+        """Precompute Arabic flags and display text, storing each category as parallel arrays"""
+        # Build into locals and assign at the end so a malformed bank leaves the current one intact
+        cat_is_arabic = {}
+        display_cat = {}
+        banks = {}
+        if not isinstance(questions_db, dict):
+            raise ValueError("Question bank must be a JSON object mapping categories to question lists")
+        for cat, questions in questions_db.items():
+            # Check the shape up front so bad data is reported as a load error
+            if not isinstance(questions, list) or not all(isinstance(q, dict) for q in questions):
+                raise ValueError(f"Category {cat!r} must be a list of question objects")
+            for q in questions:
+                if not isinstance(q['question'], str):
+                    raise ValueError(f"Question text must be a string: {q['question']!r}")
+                if not isinstance(q['options'], list) or not all(isinstance(o, str) for o in q['options']):
+                    raise ValueError(f"Options must be a list of strings for question: {q['question']}")
+            cat_is_arabic[cat] = _is_arabic(cat)
+            display_cat[cat] = self.process_text(cat)
+            texts = [q['question'] for q in questions]
+            opts = [q['options'] for q in questions]
+            answers = [q['answer'] for q in questions]
+            # Answers must be an index into the question's options
+            for text, q_opts, answer in zip(texts, opts, answers):
+                if type(answer) is not int or not 0 <= answer < len(q_opts):
+                    raise ValueError(f"Invalid answer {answer!r} for question: {text}")
+            banks[cat] = {
+                'text': texts,
+                'opts': opts,
+                'ans': array('b', answers),
+                'arabic': [_is_arabic(t) for t in texts],
+                'disp_text': [self.process_text(t) for t in texts],
+                'disp_opts': [[self.process_text(o) for o in q_opts] for q_opts in opts],
+            }
+        
+        self.questions_db = questions_db
+        self._cat_is_arabic = cat_is_arabic
+        self._display_cat = display_cat
+        self._banks = banks
+    
     def reload_questions(self):
         """Reload questions from the current file"""
         if self.current_question_file:
@@ -150,16 +319,37 @@ class ModernQuizApp:
         else:
             messagebox.showerror("Error", "Failed to reload questions!")
         
-    def show_main_screen(self):
-        """Display the main menu with category selection"""
-        # Clear everything first
-        for widget in self.root.winfo_children():
-            widget.destroy()
-        
-        # Main container with proper grid layout
-        main_frame = ctk.CTkFrame(self.root)
-        main_frame.grid(row=0, column=0, padx=20, pady=20, sticky="nsew")
-        main_frame.grid_columnconfigure(0, weight=1)
+    def _build_screens(self):
+        """Build every screen once; navigation only swaps which frame is visible"""
+        self._current_frame = None
+        self._frame_main = self._make_screen_frame()
+        self._frame_quiz = self._make_screen_frame()
+        self._frame_results = self._make_screen_frame()
+        self._frame_scores = self._make_screen_frame()
+        self._build_main_screen()
+        self._build_quiz_screen()
+        self._build_results_screen()
+        self._build_scores_screen()
+        
+    def _make_screen_frame(self):
+        """Create a hidden top-level screen frame; grid() later restores its placement"""
+        frame = ctk.CTkFrame(self.root)
+        frame.grid(row=0, column=0, padx=20, pady=20, sticky="nsew")
+        frame.grid_columnconfigure(0, weight=1)
+        frame.grid_remove()
+        return frame
+        
+    def _show(self, frame):
+        """Hide the visible screen and show the given one"""
+        if self._current_frame is not frame:
+            if self._current_frame is not None:
+                self._current_frame.grid_remove()
+            frame.grid()
+            self._current_frame = frame
+            
+    def _build_main_screen(self):
+        """Build the main menu widgets; categories are filled in by show_main_screen"""
+        main_frame = self._frame_main
         main_frame.grid_rowconfigure(1, weight=1)
         
         # Title section
@@ -169,14 +359,14 @@ class ModernQuizApp:
         main_title = ctk.CTkLabel(
             title_frame,
             text="🎯 Quiz Master Pro",
-            font=ctk.CTkFont(size=32, weight="bold")
+            font=_font(32, "bold")
         )
         main_title.pack(pady=10)
         
         tagline = ctk.CTkLabel(
             title_frame,
             text="Challenge yourself with questions from different topics!",
-            font=ctk.CTkFont(size=16)
+            font=_font(16)
         )
         tagline.pack()
         
@@ -184,58 +374,36 @@ class ModernQuizApp:
         info_frame = ctk.CTkFrame(main_frame)
         info_frame.grid(row=1, column=0, padx=20, pady=10, sticky="ew")
         
-        # Display current question file
-        file_display = os.path.basename(self.current_question_file) if self.current_question_file else "No file selected"
-        ctk.CTkLabel(
+        self._file_label = ctk.CTkLabel(
             info_frame,
-            text=f"Current Question Bank: {file_display}",
-            font=ctk.CTkFont(size=14),
-            text_color=("#F59E0B" if self.current_question_file else "#EF4444")
-        ).pack(pady=10)
+            text="",
+            font=_font(14)
+        )
+        self._file_label.pack(pady=10)
         
         # Category selection frame
-        cat_frame = ctk.CTkFrame(main_frame)
-        cat_frame.grid(row=2, column=0, padx=20, pady=20, sticky="nsew")
-        cat_frame.grid_columnconfigure(0, weight=1)
+        self._cat_frame = ctk.CTkFrame(main_frame)
+        self._cat_frame.grid(row=2, column=0, padx=20, pady=20, sticky="nsew")
+        self._cat_frame.grid_columnconfigure(0, weight=1)
         
         ctk.CTkLabel(
-            cat_frame,
+            self._cat_frame,
             text="Pick a Category:",
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=_font(20, "bold")
         ).pack(pady=20)
         
         # Category buttons container
-        cat_buttons = ctk.CTkFrame(cat_frame, fg_color="transparent")
-        cat_buttons.pack(pady=10)
-        
-        if self.questions_db:
-            categories = list(self.questions_db.keys())
-            for idx, category in enumerate(categories):
-                # Process category text for Arabic support
-                display_category = self.process_text(category)
-                # Check if category contains Arabic for RTL alignment
-                arabic_pattern = re.compile(r'[\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF\uFB50-\uFDFF\uFE70-\uFEFF]')
-                is_arabic_cat = bool(arabic_pattern.search(category))
-                
-                btn = ctk.CTkButton(
-                    cat_buttons,
-                    text=display_category,
-                    font=ctk.CTkFont(size=16, weight="bold"),
-                    width=200,
-                    height=50,
-                    command=lambda cat=category: self.begin_quiz(cat)
-                )
-                # Configure RTL for Arabic categories
-                if is_arabic_cat:
-                    btn.configure(anchor="e")
-                btn.grid(row=idx//2, column=idx%2, padx=15, pady=15)
-        else:
-            ctk.CTkLabel(
-                cat_frame,
-                text="No categories found in the question bank!",
-                font=ctk.CTkFont(size=16),
-                text_color="#EF4444"
-            ).pack(pady=20)
+        self._cat_buttons = ctk.CTkFrame(self._cat_frame, fg_color="transparent")
+        self._cat_buttons.pack(pady=10)
+        self._cat_buttons_for = None  # questions_db the buttons were built from
+        
+        # Shown instead of buttons when the bank is empty
+        self._no_cats_label = ctk.CTkLabel(
+            self._cat_frame,
+            text="No categories found in the question bank!",
+            font=_font(16),
+            text_color="#EF4444"
+        )
         
         # Options buttons frame
         options_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
@@ -245,7 +413,7 @@ class ModernQuizApp:
         highscores_btn = ctk.CTkButton(
             options_frame,
             text="🏆 View High Scores",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=_font(14, "bold"),
             width=200,
             command=self.display_highscores
         )
@@ -255,7 +423,7 @@ class ModernQuizApp:
         reload_btn = ctk.CTkButton(
             options_frame,
             text="🔄 Reload Questions",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=_font(14, "bold"),
             width=200,
             command=self.reload_questions
         )
@@ -265,12 +433,57 @@ class ModernQuizApp:
         change_btn = ctk.CTkButton(
             options_frame,
             text="📁 Change Question Bank",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=_font(14, "bold"),
             width=200,
             command=self.change_question_bank
         )
         change_btn.pack(side="left", padx=10)
         
+    def show_main_screen(self):
+        """Display the main menu with category selection"""
+        # Display current question file
+        file_display = os.path.basename(self.current_question_file) if self.current_question_file else "No file selected"
+        self._file_label.configure(
+            text=f"Current Question Bank: {file_display}",
+            text_color=("#F59E0B" if self.current_question_file else "#EF4444")
+        )
+        
+        # Category buttons only change when a new bank has been loaded
+        if self._cat_buttons_for is not self.questions_db:
+            self._populate_categories()
+            
+        self._show(self._frame_main)
+        
+    def _populate_categories(self):
+        """Rebuild the category buttons for the current question bank"""
+        for widget in self._cat_buttons.winfo_children():
+            widget.destroy()
+        self._cat_buttons_for = self.questions_db
+        
+        if self.questions_db:
+            self._no_cats_label.pack_forget()
+            categories = list(self.questions_db.keys())
+            for idx, category in enumerate(categories):
+                # Category text was shaped for Arabic support at load time
+                display_category = self._display_cat[category]
+                # Check if category contains Arabic for RTL alignment
+                is_arabic_cat = self._cat_is_arabic[category]
+                
+                btn = ctk.CTkButton(
+                    self._cat_buttons,
+                    text=display_category,
+                    font=_font(16, "bold"),
+                    width=200,
+                    height=50,
+                    command=lambda cat=category: self.begin_quiz(cat)
+                )
+                # Configure RTL for Arabic categories
+                if is_arabic_cat:
+                    btn.configure(anchor="e")
+                btn.grid(row=idx//2, column=idx%2, padx=15, pady=15)
+        else:
+            self._no_cats_label.pack(pady=20)
+        
     def change_question_bank(self):
         """Allow user to select a different question bank file"""
         file_path = filedialog.askopenfilename(
@@ -281,58 +494,48 @@ class ModernQuizApp:
         if file_path:
             self.current_question_file = file_path
             if self.load_questions_from_file(file_path):
+                self.save_config(file_path)
                 messagebox.showinfo("Success", "Question bank loaded successfully!")
                 self.show_main_screen()
         
     def begin_quiz(self, category):
         """Start a new quiz with the selected category"""
         self.current_cat = category
-        # Shuffle questions so it's different each time
-        self.quiz_questions = random.sample(self.questions_db[category], len(self.questions_db[category]))
+        # Only the category needs shaping; the "Topic: " prefix is plain ASCII
+        self._display_topic_label = "Topic: " + self._display_cat[category]
+        self._bank = self._banks[category]
+        # Shuffle question order so it's different each time
+        self._order = list(range(len(self._bank['text'])))
+        random.shuffle(self._order)
         self.q_number = 0
         self.player_score = 0
         self.wrong_answers = 0  # Reset wrong answers
         self.game_in_progress = True
         self.answer_locked = False
-        self.display_question()
-        
-    def display_question(self):
-        """Show the current question with modern UI"""
-        # Clear the screen
-        for widget in self.root.winfo_children():
-            widget.destroy()
-        
-        # Main container with proper grid layout
-        main_frame = ctk.CTkFrame(self.root)
-        main_frame.grid(row=0, column=0, padx=20, pady=20, sticky="nsew")
-        main_frame.grid_columnconfigure(0, weight=1)
         
-        # Check if quiz is over
-        if self.q_number >= len(self.quiz_questions):
-            self.show_final_results()
-            return
-            
-        current_q = self.quiz_questions[self.q_number]
-        self.answer_locked = False  # Reset for new question
-        self.chosen_option = None  # Reset chosen option
+        # Reset the per-quiz parts of the quiz screen
+        self.cat_label.configure(text=self._display_topic_label)
+        self.update_score_display()
+        self._ensure_option_buttons(max(map(len, self._bank['opts']), default=0))
+        self._show(self._frame_quiz)
+        self.display_question()
         
-        # Check if this is an Arabic quiz using inline check
-        arabic_pattern = re.compile(r'[\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF\uFB50-\uFDFF\uFE70-\uFEFF]')
-        is_arabic_quiz = bool(arabic_pattern.search(current_q['question']))
+    def _build_quiz_screen(self):
+        """Build the quiz screen widgets once; questions only update them"""
+        main_frame = self._frame_quiz
         
         # Top bar with category and score
         top_bar = ctk.CTkFrame(main_frame)
         top_bar.grid(row=0, column=0, padx=20, pady=10, sticky="ew")
         top_bar.grid_columnconfigure(1, weight=1)
         
-        # Category label - Process for Arabic support
-        display_category = self.process_text(f"Topic: {self.current_cat}")
-        cat_label = ctk.CTkLabel(
+        # Category label, shaped for Arabic support in begin_quiz
+        self.cat_label = ctk.CTkLabel(
             top_bar,
-            text=display_category,
-            font=ctk.CTkFont(size=18, weight="bold")
+            text="",
+            font=_font(18, "bold")
         )
-        cat_label.grid(row=0, column=0, padx=20, pady=10, sticky="w")
+        self.cat_label.grid(row=0, column=0, padx=20, pady=10, sticky="w")
         
         # Score display - Format: correct(green) - wrong(red)
         score_frame = ctk.CTkFrame(top_bar, fg_color="transparent")
@@ -342,7 +545,7 @@ class ModernQuizApp:
         self.correct_label = ctk.CTkLabel(
             score_frame,
             text=str(self.player_score),
-            font=ctk.CTkFont(size=18, weight="bold"),
+            font=_font(18, "bold"),
             text_color="#10B981"
         )
         self.correct_label.pack(side="left")
@@ -351,7 +554,7 @@ class ModernQuizApp:
         separator_label = ctk.CTkLabel(
             score_frame,
             text=" - ",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=_font(18, "bold")
         )
         separator_label.pack(side="left")
         
@@ -359,7 +562,7 @@ class ModernQuizApp:
         self.wrong_label = ctk.CTkLabel(
             score_frame,
             text=str(self.wrong_answers),
-            font=ctk.CTkFont(size=18, weight="bold"),
+            font=_font(18, "bold"),
             text_color="#EF4444"
         )
         self.wrong_label.pack(side="left")
@@ -368,33 +571,27 @@ class ModernQuizApp:
         progress_frame = ctk.CTkFrame(main_frame)
         progress_frame.grid(row=1, column=0, padx=20, pady=5, sticky="ew")
         
-        progress_bar = ctk.CTkProgressBar(
+        self.progress_bar = ctk.CTkProgressBar(
             progress_frame,
             progress_color=("#3B82F6", "#1D4ED8"),
             width=400
         )
-        progress_bar.pack(pady=10)
-        progress_bar.set(self.q_number / len(self.quiz_questions))
+        self.progress_bar.pack(pady=10)
         
         # Question counter
-        counter_text = f"Question {self.q_number + 1} of {len(self.quiz_questions)}"
-        # if is_arabic_quiz:
-        #     counter_text = f"السؤال {self.q_number + 1} من {len(self.quiz_questions)}"
-        ctk.CTkLabel(
+        self.counter_label = ctk.CTkLabel(
             progress_frame,
-            text=counter_text,
-            font=ctk.CTkFont(size=14)
-        ).pack(pady=5)
+            text="",
+            font=_font(14)
+        )
+        self.counter_label.pack(pady=5)
         
         # Timer display
-        timer_text = f"Time: {self.time_remaining}s"
-        # if is_arabic_quiz:
-        #     timer_text = f"الوقت: {self.time_remaining} ثانية"
         self.timer_display = ctk.CTkLabel(
             progress_frame,
-            text=timer_text,
-            font=ctk.CTkFont(size=18, weight="bold"),
-            text_color=("#F59E0B" if self.time_remaining > 10 else "#EF4444")
+            text="",
+            font=_font(18, "bold"),
+            text_color="#F59E0B"
         )
         self.timer_display.pack(pady=5)
         
@@ -403,45 +600,89 @@ class ModernQuizApp:
         q_card.grid(row=2, column=0, padx=20, pady=20, sticky="ew")
         q_card.grid_columnconfigure(0, weight=1)
         
-        # Process question text for Arabic support
-        question_text = self.process_text(current_q['question'])
-        question_label = ctk.CTkLabel(
+        self.question_label = ctk.CTkLabel(
             q_card,
-            text=question_text,
-            font=ctk.CTkFont(size=20, weight="bold"),
-            wraplength=800,  # Ensure text wraps properly
-            justify="right" if is_arabic_quiz else "center"
+            text="",
+            font=_font(20, "bold"),
+            wraplength=800  # Ensure text wraps properly
         )
-        question_label.grid(row=0, column=0, padx=30, pady=30, sticky="ew")
-        
-        # Answer options frame
-        options_frame = ctk.CTkFrame(main_frame)
-        options_frame.grid(row=3, column=0, padx=20, pady=20, sticky="ew")
-        options_frame.grid_columnconfigure(0, weight=1)
+        self.question_label.grid(row=0, column=0, padx=30, pady=30, sticky="ew")
         
+        # Answer options frame; buttons are added by _ensure_option_buttons
+        self._options_frame = ctk.CTkFrame(main_frame)
+        self._options_frame.grid(row=3, column=0, padx=20, pady=20, sticky="ew")
+        self._options_frame.grid_columnconfigure(0, weight=1)
         self.option_buttons = []
-        for i, option in enumerate(current_q['options']):
-            # Process option text for Arabic support
-            display_option = self.process_text(option)
+        
+    def _ensure_option_buttons(self, count):
+        """Create option buttons until there are at least `count`; extras are hidden per question"""
+        for i in range(len(self.option_buttons), count):
             # Create option button with proper styling
             opt_btn = ctk.CTkButton(
-                options_frame,
-                text=display_option,
-                font=ctk.CTkFont(size=16),
-                height=50,
-                command=lambda idx=i: self.on_answer_click(idx),
-                anchor="e" if is_arabic_quiz else "center"
+                self._options_frame,
+                text="",
+                font=_font(16),
+                height=50
             )
             opt_btn.grid(row=i, column=0, padx=20, pady=10, sticky="ew")
             
             # Store the index with the button
             opt_btn.answer_index = i
             self.option_buttons.append(opt_btn)
+            
+            # Remember the theme color so highlighted answers can be reset
+            if i == 0:
+                self._option_default_color = opt_btn.cget("fg_color")
+        
+    def display_question(self):
+        """Show the current question, or the results once the quiz is over"""
+        # Check if quiz is over
+        if self.q_number >= len(self._order):
+            self.show_final_results()
+            return
+        
+        self._refresh_question()
+        
+    def _refresh_question(self):
+        """Update the existing quiz widgets with the current question"""
+        bank = self._bank
+        qi = self._order[self.q_number]
+        self.answer_locked = False  # Reset for new question
+        self.chosen_option = None  # Reset chosen option
+        
+        # Check if this is an Arabic quiz
+        is_arabic_quiz = bank['arabic'][qi]
+        
+        self.progress_bar.set(self.q_number / len(self._order))
+        
+        # Question counter
+        counter_text = f"Question {self.q_number + 1} of {len(self._order)}"
+        # if is_arabic_quiz:
+        #     counter_text = f"السؤال {self.q_number + 1} من {len(self._order)}"
+        self.counter_label.configure(text=counter_text)
+        
+        # Question text was shaped for Arabic support at load time
+        self.question_label.configure(
+            text=bank['disp_text'][qi],
+            justify="right" if is_arabic_quiz else "center"
+        )
+        
+        display_options = bank['disp_opts'][qi]
+        for i, opt_btn in enumerate(self.option_buttons):
+            if i < len(display_options):
+                opt_btn.configure(
+                    text=display_options[i],
+                    fg_color=self._option_default_color,
+                    state="normal",
+                    command=lambda idx=i: self.on_answer_click(idx),
+                    anchor="e" if is_arabic_quiz else "center"
+                )
+                opt_btn.grid()
+            else:
+                opt_btn.grid_remove()
         
         # Start the countdown timer
-        self.time_remaining = 30
-        self.timer_active = True
-        self.run_timer()
+        self._start_question_timer()
         
     def update_score_display(self):
         """Update the score display with correct(green) - wrong(red) format"""
@@ -462,29 +703,29 @@ class ModernQuizApp:
             return  # Prevent multiple clicks
             
         self.answer_locked = True
-        self.timer_active = False  # Stop the timer
+        self._cancel_question_timer()  # Stop the timer
         
-        print(f"Answer clicked: {index}")  # Debug
+        log.debug("Answer clicked: %d", index)
         
         # Highlight selected answer
         self.chosen_option = index
         
-        current_q = self.quiz_questions[self.q_number]
+        answer = self._bank['ans'][self._order[self.q_number]]
         
         # Check if correct and update score
-        is_correct = (self.chosen_option == current_q['answer'])
+        is_correct = (self.chosen_option == answer)
         
         if is_correct:
             # Correct answer!
             self.option_buttons[index].configure(fg_color=("#10B981", "#059669"))
             self.player_score += 1
-            print(f"Correct! Score: {self.player_score}")  # Debug
+            log.debug("Correct! Score: %d", self.player_score)
         else:
             # Wrong answer - show selected in red and correct in green
             self.option_buttons[index].configure(fg_color=("#EF4444", "#DC2626"))
-            self.option_buttons[current_q['answer']].configure(fg_color=("#10B981", "#059669"))
+            self.option_buttons[answer].configure(fg_color=("#10B981", "#059669"))
             self.wrong_answers += 1  # Increment wrong answers
-            print(f"Wrong! Score: {self.player_score}")  # Debug
+            log.debug("Wrong! Score: %d", self.player_score)
         
         # Disable all options
         for btn in self.option_buttons:
@@ -498,68 +739,79 @@ class ModernQuizApp:
         
     def auto_next_question(self):
         """Automatically move to the next question"""
-        print(f"Auto-moving to the next question. Current: {self.q_number}")  # Debug
+        log.debug("Auto-moving to the next question. Current: %d", self.q_number)
         self.q_number += 1
         self.display_question()
         
-    def run_timer(self):
-        """Countdown timer for each question"""
-        if self.timer_active and self.time_remaining > 0:
-            self.time_remaining -= 1
-            
-            # Update timer text based on language
-            current_q = self.quiz_questions[self.q_number]
-            # Check if this is an Arabic quiz using inline check
-            arabic_pattern = re.compile(r'[\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF\uFB50-\uFDFF\uFE70-\uFEFF]')
-            is_arabic_quiz = bool(arabic_pattern.search(current_q['question']))
+    def _start_question_timer(self):
+        """Schedule the timeout for the current question and start the countdown display"""
+        self._cancel_question_timer()
+        self._deadline = time.monotonic() + QUESTION_TIME_LIMIT
+        self._last_shown = None
+        self.timer_active = True
+        self.timer_display.configure(text_color="#F59E0B")
+        self._timeout_after_id = self.root.after(QUESTION_TIME_LIMIT * 1000, self._on_timeout)
+        self._tick()
+        
+    def _cancel_question_timer(self):
+        """Stop the countdown and drop any pending timer callbacks"""
+        self.timer_active = False
+        if self._timeout_after_id is not None:
+            self.root.after_cancel(self._timeout_after_id)
+            self._timeout_after_id = None
+        if self._tick_after_id is not None:
+            self.root.after_cancel(self._tick_after_id)
+            self._tick_after_id = None
             
-            timer_text = f"Time: {self.time_remaining}s"
+    def _tick(self):
+        """Refresh the countdown label; only touches the widget when the second changes"""
+        self._tick_after_id = None
+        remaining = max(0, int(self._deadline - time.monotonic()))
+        if remaining != self._last_shown:
+            self._last_shown = remaining
+            self.time_remaining = remaining
+            self.timer_display.configure(text=f"Time: {remaining}s")
             # if is_arabic_quiz:
-            #     timer_text = f"الوقت: {self.time_remaining} ثانية"
-                
-            self.timer_display.configure(text=timer_text)
+            #     timer_text = f"الوقت: {remaining} ثانية"
             
             # Make it red when time is running out
-            if self.time_remaining <= 10:
+            if remaining <= 10:
                 self.timer_display.configure(text_color="#EF4444")
+        
+        # Poll a few times a second so the display stays in step with the deadline
+        if remaining > 0:
+            self._tick_after_id = self.root.after(250, self._tick)
             
-            # Continue counting
-            self.root.after(1000, self.run_timer)
-        elif self.timer_active:
-            # Time's up - treat as no answer
-            self.answer_locked = True
-            current_q = self.quiz_questions[self.q_number]
-            
-            # Show the correct answer
-            self.option_buttons[current_q['answer']].configure(fg_color=("#10B981", "#059669"))
-            
-            # Add to score history as wrong
-            self.wrong_answers += 1
-            
-            # Disable all options
-            for btn in self.option_buttons:
-                btn.configure(state="disabled")
-            
-            # Update score display
-            self.update_score_display()
-            
-            # Wait 1.5 seconds then go to the next question
-            self.root.after(1500, self.auto_next_question)
-            
-    def show_final_results(self):
-        """Display the final score and results"""
-        # Clear the screen
-        for widget in self.root.winfo_children():
-            widget.destroy()
+    def _on_timeout(self):
+        """Time's up - treat as no answer"""
+        self._timeout_after_id = None
+        if not self.timer_active:
+            return
+        self._cancel_question_timer()
+        self.answer_locked = True
+        self.time_remaining = 0
+        self.timer_display.configure(text="Time: 0s", text_color="#EF4444")
+        answer = self._bank['ans'][self._order[self.q_number]]
+        
+        # Show the correct answer
+        self.option_buttons[answer].configure(fg_color=("#10B981", "#059669"))
+        
+        # Add to score history as wrong
+        self.wrong_answers += 1
+        
+        # Disable all options
+        for btn in self.option_buttons:
+            btn.configure(state="disabled")
         
-        # Check if this was an Arabic quiz using inline check
-        arabic_pattern = re.compile(r'[\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF\uFB50-\uFDFF\uFE70-\uFEFF]')
-        is_arabic_quiz = bool(arabic_pattern.search(self.current_cat))
+        # Update score display
+        self.update_score_display()
         
-        # Main container with proper grid layout
-        main_frame = ctk.CTkFrame(self.root)
-        main_frame.grid(row=0, column=0, padx=20, pady=20, sticky="nsew")
-        main_frame.grid_columnconfigure(0, weight=1)
+        # Wait 1.5 seconds then go to the next question
+        self.root.after(1500, self.auto_next_question)
+            
+    def _build_results_screen(self):
+        """Build the results screen widgets; show_final_results fills them in"""
+        main_frame = self._frame_results
         
         # Results card
         results_card = ctk.CTkFrame(main_frame)
@@ -570,215 +822,251 @@ class ModernQuizApp:
         ctk.CTkLabel(
             results_card,
             text="🏆",
-            font=ctk.CTkFont(size=72)
+            font=_font(72)
         ).grid(row=0, column=0, pady=20)
         
         # Results title
-        title_text = "Quiz Complete!"
-        if is_arabic_quiz:
-            title_text = "انتهى الاختبار!"
-        ctk.CTkLabel(
+        self._results_title = ctk.CTkLabel(
             results_card,
-            text=self.process_text(title_text),
-            font=ctk.CTkFont(size=32, weight="bold")
-        ).grid(row=1, column=0, pady=10)
-        
-        # Calculate percentage
-        total_qs = len(self.quiz_questions)
-        percent = (self.player_score / total_qs) * 100
+            text="",
+            font=_font(32, "bold")
+        )
+        self._results_title.grid(row=1, column=0, pady=10)
         
         # Score display with the same format as during quiz
         score_frame = ctk.CTkFrame(results_card, fg_color="transparent")
         score_frame.grid(row=2, column=0, pady=10)
         
         # Correct score in green
-        correct_label = ctk.CTkLabel(
+        self._results_correct = ctk.CTkLabel(
             score_frame,
-            text=str(self.player_score),
-            font=ctk.CTkFont(size=24, weight="bold"),
+            text="",
+            font=_font(24, "bold"),
             text_color="#10B981"
         )
-        correct_label.pack(side="left")
+        self._results_correct.pack(side="left")
         
         # Separator
         separator_label = ctk.CTkLabel(
             score_frame,
             text=" - ",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=_font(24, "bold")
         )
         separator_label.pack(side="left")
         
         # Wrong score in red
-        wrong_label = ctk.CTkLabel(
+        self._results_wrong = ctk.CTkLabel(
             score_frame,
-            text=str(self.wrong_answers),
-            font=ctk.CTkFont(size=24, weight="bold"),
+            text="",
+            font=_font(24, "bold"),
             text_color="#EF4444"
         )
-        wrong_label.pack(side="left")
+        self._results_wrong.pack(side="left")
         
         # Percentage
-        percent_text = f"{percent:.1f}%"
-        ctk.CTkLabel(
+        self._results_percent = ctk.CTkLabel(
             results_card,
-            text=percent_text,
-            font=ctk.CTkFont(size=20, weight="bold"),
-            text_color=("#10B981" if percent >= 60 else "#F59E0B")
-        ).grid(row=3, column=0, pady=5)
+            text="",
+            font=_font(20, "bold")
+        )
+        self._results_percent.grid(row=3, column=0, pady=5)
         
-        # Motivational message based on performance
-        if percent >= 80:
-            msg = "Amazing! You're a quiz champion! 🌟"
-            msg_color = "#10B981"
-        elif percent >= 60:
-            msg = "Good work! Keep it up! 👍"
-            msg_color = "#F59E0B"
-        else:
-            msg = "Nice try! Practice makes perfect! 💪"
-            msg_color = "#EF4444"
-            
-        ctk.CTkLabel(
+        # Motivational message
+        self._results_msg = ctk.CTkLabel(
             results_card,
-            text=self.process_text(msg),
-            font=ctk.CTkFont(size=16),
-            text_color=msg_color
-        ).grid(row=4, column=0, pady=20)
+            text="",
+            font=_font(16)
+        )
+        self._results_msg.grid(row=4, column=0, pady=20)
         
         # Action buttons
         button_row = ctk.CTkFrame(results_card, fg_color="transparent")
         button_row.grid(row=5, column=0, pady=30)
         
         # Play again button
-        play_text = "Play Again" if not is_arabic_quiz else "العب مرة أخرى"
-        again_btn = ctk.CTkButton(
+        self._again_btn = ctk.CTkButton(
             button_row,
-            text=self.process_text(play_text),
-            font=ctk.CTkFont(size=14, weight="bold"),
+            text="",
+            font=_font(14, "bold"),
             width=150,
             command=lambda: self.begin_quiz(self.current_cat)
         )
-        again_btn.pack(side="left", padx=10)
+        self._again_btn.pack(side="left", padx=10)
         
         # Main menu button
-        menu_text = "Main Menu" if not is_arabic_quiz else "القائمة الرئيسية"
-        menu_btn = ctk.CTkButton(
+        self._menu_btn = ctk.CTkButton(
             button_row,
-            text=self.process_text(menu_text),
-            font=ctk.CTkFont(size=14, weight="bold"),
+            text="",
+            font=_font(14, "bold"),
             width=150,
             command=self.show_main_screen
         )
-        menu_btn.pack(side="left", padx=10)
+        self._menu_btn.pack(side="left", padx=10)
+        
+    def show_final_results(self):
+        """Display the final score and results"""
+        # Check if this was an Arabic quiz
+        is_arabic_quiz = self._cat_is_arabic[self.current_cat]
+        
+        # Calculate percentage
+        total_qs = len(self._order)
+        percent = (self.player_score / total_qs) * 100
+        
+        # Motivational message based on performance
+        if percent >= 80:
+            msg = "Amazing! You're a quiz champion! 🌟"
+            msg_color = "#10B981"
+        elif percent >= 60:
+            msg = "Good work! Keep it up! 👍"
+            msg_color = "#F59E0B"
+        else:
+            msg = "Nice try! Practice makes perfect! 💪"
+            msg_color = "#EF4444"
+            
+        self._results_title.configure(text=self.process_text(_RESULTS_TITLE[is_arabic_quiz]))
+        self._results_correct.configure(text=str(self.player_score))
+        self._results_wrong.configure(text=str(self.wrong_answers))
+        self._results_percent.configure(
+            text=f"{percent:.1f}%",
+            text_color=("#10B981" if percent >= 60 else "#F59E0B")
+        )
+        self._results_msg.configure(text=self.process_text(msg), text_color=msg_color)
+        self._again_btn.configure(text=self.process_text(_PLAY_AGAIN_TEXT[is_arabic_quiz]))
+        self._menu_btn.configure(text=self.process_text(_MAIN_MENU_TEXT[is_arabic_quiz]))
+        self._show(self._frame_results)
         
         # Save this score
         self.save_score(self.player_score, self.current_cat)
         
-    def save_score(self, score, category):
-        """Save high scores to a JSON file"""
+    def load_scores(self):
+        """Load high scores from the JSON file, or start fresh"""
         try:
-            # Try to load existing scores
-            with open('quiz_scores.json', 'r', encoding='utf-8') as f:
-                saved_scores = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            # Create new if doesn't exist
-            saved_scores = {}
+            with open(SCORES_FILE, 'rb') as f:
+                scores = _loads(f.read())
+        except (OSError, ValueError):
+            # Create new if missing or unreadable (ValueError covers bad JSON and bad UTF-8)
+            return {}
+        if not isinstance(scores, dict):
+            return {}
+        # Drop categories that aren't a list of score entries
+        return {
+            cat: entries for cat, entries in scores.items()
+            if isinstance(entries, list)
+            and all(isinstance(e, dict) and isinstance(e.get('score'), (int, float)) and 'date' in e
+                    for e in entries)
+        }
             
+    def save_score(self, score, category):
+        """Record a score in memory and write the high scores file if it changed"""
+        saved_scores = self._scores_db
+        
         # Add score for this category
         if category not in saved_scores:
             saved_scores[category] = []
             
-        saved_scores[category].append({
+        entry = {
             'score': score,
-            'date': datetime.now().strftime('%Y-%m-%d %H:%M')
-        })
+            'date': time.strftime('%Y-%m-%d %H:%M')
+        }
+        saved_scores[category].append(entry)
         
         # Keep only top 5 scores
-        saved_scores[category] = sorted(saved_scores[category], 
-                                       key=lambda x: x['score'], 
-                                       reverse=True)[:5]
+        saved_scores[category] = nlargest(5, saved_scores[category], key=itemgetter('score'))
         
-        # Save back to file
-        with open('quiz_scores.json', 'w', encoding='utf-8') as f:
-            json.dump(saved_scores, f, indent=2, ensure_ascii=False)
-            
-    def display_highscores(self):
-        """Show the high scores screen"""
-        # Clear the screen
-        for widget in self.root.winfo_children():
-            widget.destroy()
+        # Nothing to write if the new score didn't make the top 5
+        if not any(s is entry for s in saved_scores[category]):
+            return
         
-        # Main container with proper grid layout
-        main_frame = ctk.CTkFrame(self.root)
-        main_frame.grid(row=0, column=0, padx=20, pady=20, sticky="nsew")
-        main_frame.grid_columnconfigure(0, weight=1)
+        # Write to a temp file and swap it in so a crash never leaves a partial file
+        self._write_file(SCORES_FILE, _dumps(saved_scores))
+            
+    def _build_scores_screen(self):
+        """Build the high scores screen; display_highscores fills in the list"""
+        main_frame = self._frame_scores
         
         # Title
         ctk.CTkLabel(
             main_frame,
             text="🏆 Hall of Fame",
-            font=ctk.CTkFont(size=32, weight="bold")
+            font=_font(32, "bold")
         ).grid(row=0, column=0, pady=20)
         
-        # Scores card with scrollable frame
-        scores_card = ctk.CTkScrollableFrame(main_frame, height=400)
-        scores_card.grid(row=1, column=0, padx=20, pady=20, sticky="nsew")
-        scores_card.grid_columnconfigure(0, weight=1)
+        # All scores go into one read-only textbox, which scrolls on its own
+        self._scores_box = ctk.CTkTextbox(
+            main_frame,
+            height=400,
+            font=_font(16),
+            wrap="word",
+            state="disabled"
+        )
+        self._scores_box.grid(row=1, column=0, padx=20, pady=20, sticky="nsew")
+        # Arabic categories are right-aligned; "rtl" is configured last so it wins
+        self._scores_box.tag_config("center", justify="center")
+        self._scores_box.tag_config("rtl", justify="right")
         
-        # Load scores
-        try:
-            with open('quiz_scores.json', 'r', encoding='utf-8') as f:
-                scores_data = json.load(f)
-        except:
-            scores_data = {}
+        # Back button
+        back_btn = ctk.CTkButton(
+            main_frame,
+            text="← Back to Menu",
+            font=_font(14, "bold"),
+            width=200,
+            command=self.show_main_screen
+        )
+        back_btn.grid(row=2, column=0, pady=20)
         
+    def display_highscores(self):
+        """Show the high scores screen"""
+        # Scores are kept in memory, no need to re-read the file
+        scores_data = self._scores_db
+        
+        lines = []
+        rtl_ranges = []  # (first, last) 1-based line numbers of Arabic category blocks
         if not scores_data:
-            ctk.CTkLabel(
-                scores_card,
-                text="No scores recorded yet!",
-                font=ctk.CTkFont(size=16)
-            ).pack(pady=20)
+            lines.append("No scores recorded yet!")
         else:
             # Show scores for each category
             for cat, cat_scores in scores_data.items():
-                # Category header - Process for Arabic support
-                display_category = self.process_text(cat)
-                # Check if category contains Arabic for RTL alignment
-                arabic_pattern = re.compile(r'[\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF\uFB50-\uFDFF\uFE70-\uFEFF]')
-                is_arabic_cat = bool(arabic_pattern.search(cat))
+                # Category header and RTL flag, precomputed at load time
+                # (scores may reference categories missing from the current bank)
+                if cat in self._display_cat:
+                    display_category = self._display_cat[cat]
+                    is_arabic_cat = self._cat_is_arabic[cat]
+                else:
+                    display_category = self.process_text(cat)
+                    is_arabic_cat = _is_arabic(cat)
                 
-                cat_label = ctk.CTkLabel(
-                    scores_card,
-                    text=display_category,
-                    font=ctk.CTkFont(size=18, weight="bold"),
-                    anchor="e" if is_arabic_cat else "center"
-                )
-                cat_label.pack(pady=(20, 10))
+                first = len(lines) + 1
+                lines.append(display_category)
                 
                 # List scores
+                max_possible = len(self.questions_db.get(cat, []))
                 for rank, score_info in enumerate(cat_scores, 1):
-                    max_possible = len(self.questions_db.get(cat, []))
-                    score_line = f"{rank}. {score_info['score']}/{max_possible} - {score_info['date']}"
-                    if is_arabic_cat:
-                        score_line = f"{rank}. {score_info['score']}/{max_possible} - {score_info['date']}"
-                    ctk.CTkLabel(
-                        scores_card,
-                        text=score_line,
-                        font=ctk.CTkFont(size=14),
-                        anchor="e" if is_arabic_cat else "center"
-                    ).pack(pady=2)
-        
-        # Back button
-        back_btn = ctk.CTkButton(
-            main_frame,
-            text="← Back to Menu",
-            font=ctk.CTkFont(size=14, weight="bold"),
-            width=200,
-            command=self.show_main_screen
-        )
-        back_btn.grid(row=2, column=0, pady=20)
+                    lines.append(f"{rank}. {score_info['score']}/{max_possible} - {score_info['date']}")
+                if is_arabic_cat:
+                    rtl_ranges.append((first, len(lines)))
+                lines.append("")
+        
+        # Replace the whole list in a single insert
+        box = self._scores_box
+        box.configure(state="normal")
+        box.delete("1.0", "end")
+        box.insert("1.0", "\n".join(lines))
+        box.tag_add("center", "1.0", "end")
+        for first, last in rtl_ranges:
+            box.tag_add("rtl", f"{first}.0", f"{last}.end")
+        box.configure(state="disabled")
+        
+        self._show(self._frame_scores)
 
 # Main execution
 if __name__ == "__main__":
+    # Debug messages stay silent unless the level is lowered here
+    logging.basicConfig(level=logging.WARNING)
+    
+    # Optional one-off dependency install, kept off the normal startup path
+    if "--install-deps" in sys.argv[1:]:
+        install_arabic_support()
+    
     # Create and run the app
     root = ctk.CTk()
     app = ModernQuizApp(root)